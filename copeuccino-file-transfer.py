@@ -10,16 +10,143 @@ Licensed under the MIT License - see LICENSE file for details.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import errno
+import functools
 import os
+import secrets
 import shutil
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import platform
 import psutil
 from typing import List, Dict, Optional
 import hashlib
 
+try:
+    # Optional: BLAKE3 is several times faster than SHA-256 in software
+    from blake3 import blake3 as new_digest
+except ImportError:
+    new_digest = hashlib.sha256
+
+
+# Size of each chunk handed to the kernel or read in userspace
+COPY_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Bytes at the start of each source file the kernel is asked to prefetch
+READAHEAD_SIZE = 16 * 1024 * 1024  # 16MB
+
+# Destination files at least this big are flushed to disk as soon as they
+# are written
+WRITEBACK_THRESHOLD = 64 * 1024 * 1024  # 64MB
+
+# Copy loops check for cancellation once per this many bytes
+CANCEL_POLL_BYTES = 16 * 1024 * 1024  # 16MB
+
+# errno values meaning a zero-copy syscall can't be used for this pair of
+# files, so the copy moves on to the next (slower) method
+_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.ENOTSUP, errno.EOPNOTSUPP}
+
+# Unverified files smaller than this are copied in one shutil.copyfile call
+# (except on Windows, where CopyFileExW is used for every unverified copy)
+SMALL_FILE_THRESHOLD = 16 * 1024 * 1024  # 16MB
+
+# Progress callbacks fire at most once per this many bytes or seconds
+PROGRESS_BYTES = 4 * 1024 * 1024  # 4MB
+PROGRESS_INTERVAL = 0.05
+
+# Filesystems that never make sense as a transfer destination
+_SKIP_FSTYPES = {'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'proc', 'sysfs',
+                 'cgroup', 'cgroup2', 'autofs', 'fuse.gvfsd-fuse'}
+
+# Units used by format_bytes, each 1024 times the previous one
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# How often the status text is refreshed during a transfer
+STATUS_INTERVAL_MS = 50
+
+# Drive information is reused for this long before querying the drives again
+DRIVE_CACHE_SECONDS = 5
+
+# Drives that don't report their usage within this many seconds are left out
+DRIVE_USAGE_TIMEOUT = 1
+
+# Files smaller than this aren't prefetched, the extra open and close
+# costs more than the read it would hide
+PREFETCH_MIN_SIZE = 64 * 1024  # 64KB
+
+# Number of destination files that may be waiting for verification while
+# the next file is copied
+VERIFY_WINDOW = 4
+
+# CopyFileExW progress routine return values and flags (winbase.h)
+_PROGRESS_CONTINUE = 0
+_PROGRESS_CANCEL = 1
+_COPY_FILE_NO_BUFFERING = 0x00001000
+_ERROR_REQUEST_ABORTED = 1235
+
+# Files larger than this are copied without the Windows file cache
+NO_BUFFERING_THRESHOLD = 256 * 1024 * 1024  # 256MB
+
+
+def _fadvise(fd: int, offset: int, length: int, advice: str):
+    """Pass an access pattern hint to the kernel where posix_fadvise exists"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, getattr(os, advice))
+        except OSError:
+            pass  # Only a hint, the copy works without it
+
+
+def _fdatasync(fd: int):
+    """Flush file data (not metadata) to disk, fsync where fdatasync is missing"""
+    getattr(os, 'fdatasync', os.fsync)(fd)
+
+
+def _copy_file_range(in_fd: int, out_fd: int, count: int) -> int:
+    """copy_file_range(2) - same filesystem, allows reflinks on btrfs/XFS"""
+    return os.copy_file_range(in_fd, out_fd, count)
+
+
+def _sendfile(in_fd: int, out_fd: int, count: int) -> int:
+    """sendfile(2) - file to file copy inside the kernel (Linux only)"""
+    return os.sendfile(out_fd, in_fd, None, count)
+
+
+@functools.lru_cache(maxsize=None)
+def _copy_file_ex():
+    """Set up CopyFileExW once, returns it with its progress routine type"""
+    import ctypes
+    from ctypes import wintypes
+    
+    progress_routine_type = ctypes.WINFUNCTYPE(
+        wintypes.DWORD,
+        ctypes.c_longlong,  # TotalFileSize
+        ctypes.c_longlong,  # TotalBytesTransferred
+        ctypes.c_longlong,  # StreamSize
+        ctypes.c_longlong,  # StreamBytesTransferred
+        wintypes.DWORD,     # dwStreamNumber
+        wintypes.DWORD,     # dwCallbackReason
+        wintypes.HANDLE,    # hSourceFile
+        wintypes.HANDLE,    # hDestinationFile
+        wintypes.LPVOID)    # lpData
+    
+    copy_file_ex = ctypes.WinDLL('kernel32', use_last_error=True).CopyFileExW
+    copy_file_ex.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, progress_routine_type,
+                             wintypes.LPVOID, ctypes.POINTER(wintypes.BOOL), wintypes.DWORD)
+    copy_file_ex.restype = wintypes.BOOL
+    return copy_file_ex, progress_routine_type
+
+
+def _disk_usage(mountpoint: str, results: Dict):
+    """Store psutil.disk_usage for a drive in results, skipped if it can't be read"""
+    try:
+        results[mountpoint] = psutil.disk_usage(mountpoint)
+    except (PermissionError, OSError):
+        pass
+
 
 class FileTransferApp:
     def __init__(self, root):
@@ -34,9 +161,32 @@ class FileTransferApp:
         
         # Variables
         self.source_files = []
+        self._source_set = set()  # Same paths as source_files, for fast lookups
         self.destination_path = tk.StringVar()
         self.transfer_active = False
         self.cancel_transfer = False
+        self._progress_value = 0.0
+        self._progress_pending = False
+        # Latest status text from the transfer thread, shown by _pump_status
+        self._pending_status = ""
+        
+        # Reused by every userspace copy (only the transfer thread copies)
+        self._copy_buffer = bytearray(COPY_CHUNK_SIZE)
+        # Destination folders already created during the current transfer
+        self._created_dirs = set()
+        
+        # hashlib releases the GIL, so verification scales across cores
+        self._hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Opens the next file of a transfer ahead of time, one at a time
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        
+        # (time collected, drive list) from the last drive scan
+        self._drives_cache = (0.0, None)
+        self._drives_loading = False
+        # Windows drive types by drive letter
+        self._drive_types = {}
+        # Drive usage queries by mountpoint, kept to spot ones still hanging
+        self._usage_threads = {}
         
         self.setup_ui()
         self.refresh_drives()
@@ -217,7 +367,8 @@ class FileTransferApp:
                                           maximum=100, length=400)
         self.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=5)
         
-        self.status_label = ttk.Label(progress_frame, text="Ready to transfer files")
+        self.status_var = tk.StringVar(value="Ready to transfer files")
+        self.status_label = ttk.Label(progress_frame, textvariable=self.status_var)
         self.status_label.grid(row=1, column=0, pady=5)
         
         # Control buttons
@@ -244,14 +395,47 @@ class FileTransferApp:
     
     def get_drives(self) -> List[Dict]:
         """Get list of available drives with their information"""
+        # Reuse the last scan for DRIVE_CACHE_SECONDS
+        cached_at, drives = self._drives_cache
+        if drives is not None and time.monotonic() - cached_at < DRIVE_CACHE_SECONDS:
+            return drives
+        
         drives = []
         
         try:
-            partitions = psutil.disk_partitions()
+            # Leave out pseudo and image filesystems (snaps, tmpfs, container
+            # overlays) before spending a statvfs call on each of them
+            partitions = [partition for partition in psutil.disk_partitions(all=False)
+                          if partition.fstype not in _SKIP_FSTYPES]
+            
+            # Query all drives at once, a slow network or USB drive shouldn't
+            # hold up the others (or the list) for more than the timeout.
+            # Daemon threads, so one stuck on a dead mount can't keep the app
+            # from exiting
+            usages = {}
+            started = []
+            for partition in partitions:
+                running = self._usage_threads.get(partition.mountpoint)
+                if running is not None and running.is_alive():
+                    # Still stuck from an earlier refresh, don't pile up another
+                    continue
+                thread = threading.Thread(target=_disk_usage,
+                                          args=(partition.mountpoint, usages), daemon=True)
+                thread.start()
+                self._usage_threads[partition.mountpoint] = thread
+                started.append(thread)
+            
+            deadline = time.monotonic() + DRIVE_USAGE_TIMEOUT
+            for thread in started:
+                thread.join(max(0.0, deadline - time.monotonic()))
+            
             for partition in partitions:
+                usage = usages.get(partition.mountpoint)
+                if usage is None:
+                    # Drive didn't answer in time or couldn't be read
+                    continue
+                
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    
                     # Format sizes
                     total_size = self.format_bytes(usage.total)
                     free_space = self.format_bytes(usage.free)
@@ -273,8 +457,11 @@ class FileTransferApp:
                     continue
                     
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to get drive information: {str(e)}")
-            
+            message = f"Failed to get drive information: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", message))
+            return drives
+        
+        self._drives_cache = (time.monotonic(), drives)
         return drives
     
     def is_external_drive(self, partition) -> bool:
@@ -284,7 +471,11 @@ class FileTransferApp:
             # On Windows, check if it's a removable drive
             import win32file
             try:
-                drive_type = win32file.GetDriveType(partition.mountpoint)
+                # A drive letter keeps its type while the app runs
+                drive_type = self._drive_types.get(partition.mountpoint)
+                if drive_type is None:
+                    drive_type = win32file.GetDriveType(partition.mountpoint)
+                    self._drive_types[partition.mountpoint] = drive_type
                 return drive_type == win32file.DRIVE_REMOVABLE
             except:
                 # Fallback: assume drives other than C: might be external
@@ -296,20 +487,38 @@ class FileTransferApp:
     
     def format_bytes(self, bytes_value: int) -> str:
         """Format bytes into human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_value < 1024.0:
-                return f"{bytes_value:.1f} {unit}"
-            bytes_value /= 1024.0
-        return f"{bytes_value:.1f} PB"
+        # Every unit is 2**10 times the previous one, so the bit length picks it
+        unit = min(len(_BYTE_UNITS) - 1, max(0, (int(bytes_value).bit_length() - 1) // 10))
+        return f"{bytes_value / (1 << (10 * unit)):.1f} {_BYTE_UNITS[unit]}"
     
     def refresh_drives(self):
-        """Refresh the drives list"""
+        """Refresh the drives list in the background"""
+        if self._drives_loading:
+            return
+        self._drives_loading = True
+        
+        drives_thread = threading.Thread(target=self.load_drives)
+        drives_thread.daemon = True
+        drives_thread.start()
+    
+    def load_drives(self):
+        """Collect drive information in a separate thread"""
+        try:
+            drives = self.get_drives()
+            self.root.after(0, lambda: self.show_drives(drives))
+        except Exception:
+            # show_drives won't run to clear the flag, let the next refresh retry
+            self._drives_loading = False
+            raise
+    
+    def show_drives(self, drives: List[Dict]):
+        """Fill the drives list with the collected drive information"""
+        self._drives_loading = False
+        
         # Clear existing items
         for item in self.drives_tree.get_children():
             self.drives_tree.delete(item)
         
-        drives = self.get_drives()
-        
         for drive in drives:
             # Add visual indicator for external drives
             display_name = drive['path']
@@ -339,16 +548,23 @@ class FileTransferApp:
             filetypes=[("All files", "*.*")]
         )
         
+        new_files = []
         for file_path in files:
-            if file_path not in self.source_files:
-                self.source_files.append(file_path)
-                self.source_listbox.insert(tk.END, file_path)
+            if file_path not in self._source_set:
+                self._source_set.add(file_path)
+                new_files.append(file_path)
+        
+        if new_files:
+            # One insert for the whole selection instead of a redraw per file
+            self.source_files.extend(new_files)
+            self.source_listbox.insert(tk.END, *new_files)
     
     def add_folder(self):
         """Add a folder (with all its contents) to the source list"""
         folder_path = filedialog.askdirectory(title="Select folder to transfer")
         
-        if folder_path and folder_path not in self.source_files:
+        if folder_path and folder_path not in self._source_set:
+            self._source_set.add(folder_path)
             self.source_files.append(folder_path)
             self.source_listbox.insert(tk.END, f"{folder_path} (Folder)")
     
@@ -359,11 +575,13 @@ class FileTransferApp:
         # Remove in reverse order to maintain indices
         for index in reversed(selected_indices):
             self.source_listbox.delete(index)
+            self._source_set.discard(self.source_files[index])
             del self.source_files[index]
     
     def clear_all(self):
         """Clear all source files"""
         self.source_files.clear()
+        self._source_set.clear()
         self.source_listbox.delete(0, tk.END)
     
     def browse_destination(self):
@@ -372,73 +590,308 @@ class FileTransferApp:
         if folder_path:
             self.destination_path.set(folder_path)
     
-    def calculate_md5(self, file_path: str) -> str:
-        """Calculate MD5 checksum of a file"""
-        hash_md5 = hashlib.md5()
+    def calculate_digest(self, file_path: str, algorithm=new_digest) -> Optional[str]:
+        """Calculate checksum of a file (BLAKE3 if installed, otherwise SHA-256)"""
         try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            with open(file_path, "rb", buffering=0) as f:
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                digest = algorithm()
+                buffer = bytearray(COPY_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    length = f.readinto(buffer)
+                    if not length:
+                        break
+                    digest.update(view[:length])
+            return digest.hexdigest()
         except Exception:
             return None
     
-    def copy_file_with_progress(self, src: str, dst: str, callback=None):
-        """Copy file with progress tracking"""
+    def calculate_md5(self, file_path: str) -> Optional[str]:
+        """Calculate MD5 checksum of a file"""
+        return self.calculate_digest(file_path, hashlib.md5)
+    
+    def kernel_copy_methods(self) -> list:
+        """Zero-copy syscalls usable on this platform, fastest first"""
+        methods = []
+        if platform.system() == "Linux":
+            if hasattr(os, 'copy_file_range'):
+                methods.append(_copy_file_range)
+            if hasattr(os, 'sendfile'):
+                methods.append(_sendfile)
+        return methods
+    
+    def copy_kernel(self, in_fd: int, out_fd: int, file_size: int, callback=None):
+        """Copy between file descriptors in the kernel, returns (bytes copied, finished)"""
+        # finished stays False when no zero-copy syscall works for these
+        # files, the caller copies the rest in userspace
+        copied = 0
+        for method in self.kernel_copy_methods():
+            next_cancel_check = copied
+            try:
+                while True:
+                    if copied >= next_cancel_check:
+                        if self.cancel_transfer:
+                            return copied, False
+                        next_cancel_check = copied + CANCEL_POLL_BYTES
+                    
+                    sent = method(in_fd, out_fd, COPY_CHUNK_SIZE)
+                    if not sent:
+                        if copied == 0 and file_size > 0:
+                            # Some filesystems report 0 instead of failing
+                            break
+                        return copied, True
+                    
+                    copied += sent
+                    
+                    if callback is not None:
+                        callback(copied, file_size)
+            except OSError as e:
+                if e.errno not in _FALLBACK_ERRNOS:
+                    raise
+                # A failed call may have moved one file position but not the
+                # other, line both up again with what was really copied
+                os.lseek(in_fd, copied, os.SEEK_SET)
+                os.lseek(out_fd, copied, os.SEEK_SET)
+        
+        return copied, False
+    
+    def copy_windows(self, src: str, dst: str, file_size: int, callback=None) -> bool:
+        """Copy a file with CopyFileExW, returns False if cancelled"""
+        # Windows picks the I/O sizes and can use SMB server-side copy, no
+        # data passes through Python
+        import ctypes
+        
+        copy_file_ex, progress_routine_type = _copy_file_ex()
+        
+        def on_progress(total, transferred, *_):
+            if self.cancel_transfer:
+                return _PROGRESS_CANCEL
+            if callback:
+                callback(transferred, total)
+            return _PROGRESS_CONTINUE
+        
+        # Keep a reference so the callback outlives the call
+        progress_routine = progress_routine_type(on_progress)
+        
+        # Bypass the cache for big files so they don't evict everything else
+        flags = _COPY_FILE_NO_BUFFERING if file_size > NO_BUFFERING_THRESHOLD else 0
+        
+        if not copy_file_ex(src, dst, progress_routine, None, None, flags):
+            error = ctypes.get_last_error()
+            if error == _ERROR_REQUEST_ABORTED:
+                return False
+            raise ctypes.WinError(error)
+        
+        return True
+    
+    def copy_stream(self, src: str, dst: str, file_size: int, callback=None, digest=None,
+                    src_fd: Optional[int] = None) -> bool:
+        """Copy a file through its file descriptors, returns False if cancelled"""
+        # Read through the descriptor prefetch_file opened if there is one,
+        # the caller still owns and closes it
+        if src_fd is not None:
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            source = open(src_fd, 'rb', buffering=0, closefd=False)
+        else:
+            source = open(src, 'rb', buffering=0)
+        
+        # Unbuffered: data goes straight from the shared buffer to the OS
+        with source as fsrc, open(dst, 'wb', buffering=0) as fdst:
+            # The source is read once, front to back: ramp up readahead and
+            # start fetching the beginning right away
+            _fadvise(fsrc.fileno(), 0, 0, 'POSIX_FADV_SEQUENTIAL')
+            _fadvise(fsrc.fileno(), 0, min(file_size, READAHEAD_SIZE), 'POSIX_FADV_WILLNEED')
+            
+            copied = 0
+            finished = False
+            
+            # With a digest the data has to pass through userspace anyway,
+            # each chunk is hashed on its way to the destination
+            if digest is None:
+                # Let the kernel move the data where possible
+                copied, finished = self.copy_kernel(fsrc.fileno(), fdst.fileno(), file_size, callback)
+                if self.cancel_transfer:
+                    return False
+                
+                # No zero-copy syscall works here, continue in userspace
+                fsrc.seek(copied)
+                fdst.seek(copied)
+            
+            # Look methods up once, this loop runs for every chunk
+            buffer = self._copy_buffer
+            view = memoryview(buffer)
+            readinto = fsrc.readinto
+            write = fdst.write
+            update = digest.update if digest is not None else None
+            next_cancel_check = copied
+            
+            while not finished:
+                if copied >= next_cancel_check:
+                    if self.cancel_transfer:
+                        return False
+                    next_cancel_check = copied + CANCEL_POLL_BYTES
+                
+                length = readinto(buffer)
+                if not length:
+                    break
+                
+                chunk = view[:length]
+                if update is not None:
+                    update(chunk)
+                
+                # Raw writes may be partial
+                written = write(chunk)
+                while written < length:
+                    written += write(chunk[written:])
+                copied += length
+                
+                if callback is not None:
+                    callback(copied, file_size)
+            
+            if digest is not None:
+                # Make sure the verification pass reads what is on disk
+                os.fsync(fdst.fileno())
+            elif file_size >= WRITEBACK_THRESHOLD:
+                # Flush big files now so DONTNEED below can drop their pages,
+                # otherwise dirty pages pile up until the kernel's writeback
+                # limit stalls the following files. (O_DIRECT would avoid the
+                # cache entirely but needs page-aligned buffers and offsets.)
+                _fdatasync(fdst.fileno())
+            
+            # One-shot copies shouldn't crowd everything else out of the page cache
+            _fadvise(fsrc.fileno(), 0, 0, 'POSIX_FADV_DONTNEED')
+            _fadvise(fdst.fileno(), 0, 0, 'POSIX_FADV_DONTNEED')
+        
+        return True
+    
+    def throttle_progress(self, callback):
+        """Limit a progress callback to every PROGRESS_BYTES or PROGRESS_INTERVAL"""
+        last_bytes = 0
+        last_time = time.monotonic()
+        
+        def report(copied, total):
+            nonlocal last_bytes, last_time
+            now = time.monotonic()
+            # The end of a file is always reported
+            if (copied >= total or copied - last_bytes >= PROGRESS_BYTES
+                    or now - last_time >= PROGRESS_INTERVAL):
+                last_bytes = copied
+                last_time = now
+                callback(copied, total)
+        
+        return report
+    
+    def reserve_destination(self, dst: str) -> str:
+        """Claim a destination file name that isn't taken yet by creating it empty"""
+        # O_EXCL checks and claims the name in one call. Past name_1.ext,
+        # random suffixes avoid counting up through every taken name
+        base, ext = os.path.splitext(dst)
+        candidate = dst
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        
+        while True:
+            try:
+                fd = os.open(candidate, flags, 0o666)
+            except FileExistsError:
+                if candidate == dst:
+                    candidate = f"{base}_1{ext}"
+                else:
+                    candidate = f"{base}_{secrets.token_hex(4)}{ext}"
+                continue
+            
+            os.close(fd)
+            return candidate
+    
+    def copy_file_with_progress(self, src: str, dst: str, callback=None,
+                                overwrite: Optional[bool] = None, verify: Optional[bool] = None,
+                                src_fd: Optional[int] = None):
+        """Copy file with progress tracking, returns (destination, source checksum) or None"""
+        # The checksum is None when verification is off; comparing it against
+        # the destination is left to the caller. Unset options fall back to
+        # the current Transfer Options
+        if overwrite is None:
+            overwrite = self.overwrite_existing.get()
+        if verify is None:
+            verify = self.verify_checksum.get()
+        
         if os.path.isfile(src):
             # Ensure destination directory exists
-            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            dst_dir = os.path.dirname(dst)
+            if dst_dir not in self._created_dirs:
+                os.makedirs(dst_dir, exist_ok=True)
+                self._created_dirs.add(dst_dir)
             
             # Check if file exists and handle overwrite option
-            if os.path.exists(dst) and not self.overwrite_existing.get():
-                base, ext = os.path.splitext(dst)
-                counter = 1
-                while os.path.exists(f"{base}_{counter}{ext}"):
-                    counter += 1
-                dst = f"{base}_{counter}{ext}"
+            if not overwrite:
+                dst = self.reserve_destination(dst)
+            
+            if callback:
+                callback = self.throttle_progress(callback)
             
-            # Copy file in chunks with progress
+            # Hash the source while copying it instead of reading it twice
+            src_digest = new_digest() if verify else None
+            
+            # Copy file with progress, using the native copy routine
             file_size = os.path.getsize(src)
-            copied = 0
             
-            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
-                while True:
-                    if self.cancel_transfer:
-                        return False
-                    
-                    chunk = fsrc.read(64 * 1024)  # 64KB chunks
-                    if not chunk:
-                        break
-                    
-                    fdst.write(chunk)
-                    copied += len(chunk)
-                    
-                    if callback:
-                        callback(copied, file_size)
+            if platform.system() == "Windows" and src_digest is None:
+                completed = self.copy_windows(src, dst, file_size, callback)
+            elif src_digest is None and file_size < SMALL_FILE_THRESHOLD:
+                # Too quick to need progress or cancel checks, let shutil pick
+                # the platform's fastest whole-file copy (sendfile on Linux,
+                # fcopyfile on macOS; on Windows it is a plain read loop,
+                # so Windows uses CopyFileExW above instead)
+                shutil.copyfile(src, dst)
+                if callback:
+                    callback(file_size, file_size)
+                completed = True
+            else:
+                completed = self.copy_stream(src, dst, file_size, callback, src_digest, src_fd)
             
-            # Verify checksum if enabled
-            if self.verify_checksum.get():
-                src_checksum = self.calculate_md5(src)
-                dst_checksum = self.calculate_md5(dst)
-                
-                if src_checksum != dst_checksum:
-                    raise Exception(f"Checksum verification failed for {os.path.basename(src)}")
+            if not completed:
+                return None
             
-            return True
-        return False
+            return dst, (src_digest.hexdigest() if src_digest is not None else None)
+        return None
     
-    def get_all_files(self, path: str) -> List[str]:
-        """Get all files from a path (file or directory)"""
-        files = []
+    def check_verification(self, src: str, dst_future, src_checksum: str):
+        """Compare a pending destination checksum against its source"""
+        if dst_future.result() != src_checksum:
+            raise Exception(f"Checksum verification failed for {os.path.basename(src)}")
+    
+    def iter_files(self, source_path: str):
+        """Yield (file path, path relative to the destination, size) for a source entry"""
+        if os.path.isfile(source_path):
+            yield source_path, os.path.basename(source_path), os.path.getsize(source_path)
+        elif os.path.isdir(source_path):
+            # Keep the folder's own name, so the whole folder is recreated
+            yield from self.scan_folder(source_path, os.path.basename(source_path))
+    
+    def scan_folder(self, path: str, rel_path: str):
+        """Recursively yield the files of a folder using os.scandir"""
+        # The listing already says which entries are folders, only files
+        # need a stat call (for their size)
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return  # Skip folders that can't be read, like os.walk does
         
-        if os.path.isfile(path):
-            files.append(path)
-        elif os.path.isdir(path):
-            for root, dirs, filenames in os.walk(path):
-                for filename in filenames:
-                    files.append(os.path.join(root, filename))
+        subfolders = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry)
+                elif entry.is_file():
+                    yield entry.path, os.path.join(rel_path, entry.name), entry.stat().st_size
+            except OSError:
+                continue
         
-        return files
+        for entry in subfolders:
+            yield from self.scan_folder(entry.path, os.path.join(rel_path, entry.name))
     
     def start_transfer(self):
         """Start the file transfer process"""
@@ -460,102 +913,177 @@ class FileTransferApp:
         self.transfer_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
         
+        self._pending_status = self.status_var.get()
+        
         transfer_thread = threading.Thread(target=self.transfer_files)
         transfer_thread.daemon = True
         transfer_thread.start()
+        
+        self.root.after(STATUS_INTERVAL_MS, self._pump_status)
+    
+    def prefetch_file(self, file_path: str) -> Optional[int]:
+        """Open a file and start reading it into the cache, returns the descriptor or None"""
+        try:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except OSError:
+            return None
+        
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                _fadvise(fd, 0, READAHEAD_SIZE, 'POSIX_FADV_WILLNEED')
+            else:
+                # Without fadvise the data really is read into memory here,
+                # so only take the first chunk rather than a full readahead
+                os.read(fd, COPY_CHUNK_SIZE)
+        except OSError:
+            pass  # The copy will report real errors
+        return fd
+    
+    def release_prefetch(self, prefetch):
+        """Close the descriptor opened by a prefetch_file job"""
+        if prefetch is not None:
+            fd = prefetch.result()
+            if fd is not None:
+                os.close(fd)
     
     def transfer_files(self):
         """Transfer files in a separate thread"""
+        current = None  # Prefetch job for the file being copied
+        prefetch = None  # Prefetch job for the file after it
         try:
+            # Read the options once, Tk variable access goes through Tcl
+            dest_root = self.destination_path.get()
+            preserve = self.preserve_structure.get()
+            overwrite = self.overwrite_existing.get()
+            verify = self.verify_checksum.get()
+            
             # Collect all files to transfer
             all_files = []
             for source_path in self.source_files:
-                all_files.extend(self.get_all_files(source_path))
+                all_files.extend(self.iter_files(source_path))
             
             total_files = len(all_files)
-            total_size = sum(os.path.getsize(f) for f in all_files if os.path.isfile(f))
+            total_size = sum(size for _, _, size in all_files)
             
             transferred_files = 0
             transferred_size = 0
             
-            self.root.after(0, lambda: self.status_label.config(
-                text=f"Transferring {total_files} files ({self.format_bytes(total_size)})..."))
+            self._created_dirs.clear()
             
-            for file_path in all_files:
+            # Destination checksums still being calculated in the hash pool
+            pending_checks = deque()
+            
+            self.set_status(f"Transferring {total_files} files ({self.format_bytes(total_size)})...")
+            
+            for index, (file_path, rel_path, file_size) in enumerate(all_files):
                 if self.cancel_transfer:
                     break
                 
+                # This file was opened ahead of time, open the next one while
+                # it is being copied to hide the open and seek latency
+                current, prefetch = prefetch, None
+                if index + 1 < total_files:
+                    next_path, _, next_size = all_files[index + 1]
+                    if next_size >= PREFETCH_MIN_SIZE:
+                        prefetch = self._prefetch_pool.submit(self.prefetch_file, next_path)
+                
                 # Calculate destination path
-                if self.preserve_structure.get():
-                    # Find the source root for this file
-                    source_root = None
-                    for source_path in self.source_files:
-                        if file_path.startswith(source_path):
-                            source_root = source_path
-                            break
-                    
-                    if source_root:
-                        if os.path.isfile(source_root):
-                            # Single file
-                            rel_path = os.path.basename(file_path)
-                        else:
-                            # Directory - preserve the folder name in destination
-                            folder_name = os.path.basename(source_root)
-                            rel_path_from_source = os.path.relpath(file_path, source_root)
-                            rel_path = os.path.join(folder_name, rel_path_from_source)
-                        
-                        dest_file = os.path.join(self.destination_path.get(), rel_path)
-                    else:
-                        dest_file = os.path.join(self.destination_path.get(), os.path.basename(file_path))
+                if preserve:
+                    dest_file = os.path.join(dest_root, rel_path)
                 else:
                     # Flat structure
-                    dest_file = os.path.join(self.destination_path.get(), os.path.basename(file_path))
+                    dest_file = os.path.join(dest_root, os.path.basename(file_path))
                 
                 # Update status
-                self.root.after(0, lambda f=file_path: self.status_label.config(
-                    text=f"Copying: {os.path.basename(f)}"))
+                self.set_status(f"Copying: {os.path.basename(file_path)}")
                 
                 # Copy file with progress tracking
-                file_size = os.path.getsize(file_path)
-                
                 def progress_callback(copied, total):
-                    nonlocal transferred_size
-                    progress = ((transferred_size + copied) / total_size) * 100
-                    self.root.after(0, lambda: self.progress_var.set(progress))
+                    self.set_progress(((transferred_size + copied) / total_size) * 100)
+                
+                src_fd = current.result() if current is not None else None
+                result = self.copy_file_with_progress(file_path, dest_file, progress_callback,
+                                                      overwrite=overwrite, verify=verify,
+                                                      src_fd=src_fd)
                 
-                success = self.copy_file_with_progress(file_path, dest_file, progress_callback)
+                # Close only after the copy, which reads through it
+                self.release_prefetch(current)
+                current = None
                 
-                if success:
+                if result:
+                    copied_to, src_checksum = result
+                    if src_checksum is not None:
+                        # Hash the copy in the background while the next file is copied
+                        pending_checks.append((file_path,
+                                               self._hash_pool.submit(self.calculate_digest, copied_to),
+                                               src_checksum))
+                        if len(pending_checks) > VERIFY_WINDOW:
+                            self.check_verification(*pending_checks.popleft())
+                    
                     transferred_files += 1
                     transferred_size += file_size
                     
                     # Update overall progress
-                    progress = (transferred_size / total_size) * 100
-                    self.root.after(0, lambda: self.progress_var.set(progress))
+                    self.set_progress((transferred_size / total_size) * 100)
+            
+            # Wait for the remaining verifications
+            while pending_checks:
+                self.check_verification(*pending_checks.popleft())
             
             # Transfer complete
             if self.cancel_transfer:
-                self.root.after(0, lambda: self.status_label.config(
-                    text=f"Transfer cancelled. {transferred_files}/{total_files} files transferred."))
+                self.set_status(f"Transfer cancelled. {transferred_files}/{total_files} files transferred.")
             else:
-                self.root.after(0, lambda: self.status_label.config(
-                    text=f"Transfer complete! {transferred_files} files transferred successfully."))
+                self.set_status(f"Transfer complete! {transferred_files} files transferred successfully.")
                 self.root.after(0, lambda: messagebox.showinfo(
                     "Success", f"Transfer complete!\n{transferred_files} files transferred successfully."))
         
         except Exception as e:
-            self.root.after(0, lambda: self.status_label.config(text=f"Error: {str(e)}"))
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Transfer failed: {str(e)}"))
+            # e is cleared when the except block ends, keep the message
+            message = str(e)
+            self.set_status(f"Error: {message}")
+            self.root.after(0, lambda: messagebox.showerror("Error", f"Transfer failed: {message}"))
         
         finally:
+            self.release_prefetch(current)
+            self.release_prefetch(prefetch)
             self.transfer_active = False
+            self.root.after(0, self._pump_status)  # Show the final status
             self.root.after(0, lambda: self.transfer_btn.config(state=tk.NORMAL))
             self.root.after(0, lambda: self.cancel_btn.config(state=tk.DISABLED))
     
+    def set_status(self, text: str):
+        """Set the status text from the transfer thread"""
+        # Shown by _pump_status every STATUS_INTERVAL_MS instead of posting
+        # an event per change
+        self._pending_status = text
+    
+    def _pump_status(self):
+        """Show the latest status text, repeating while a transfer runs"""
+        if self._pending_status != self.status_var.get():
+            self.status_var.set(self._pending_status)
+        if self.transfer_active:
+            self.root.after(STATUS_INTERVAL_MS, self._pump_status)
+    
+    def set_progress(self, progress: float):
+        """Update the progress bar from the transfer thread"""
+        # Only one update is queued on the Tk main loop at a time, later
+        # values replace the queued one
+        self._progress_value = progress
+        if not self._progress_pending:
+            self._progress_pending = True
+            self.root.after(0, self._apply_progress)
+    
+    def _apply_progress(self):
+        """Show the latest progress value (runs on the Tk main loop)"""
+        self._progress_pending = False
+        self.progress_var.set(self._progress_value)
+    
     def cancel_transfer_action(self):
         """Cancel the ongoing transfer"""
         self.cancel_transfer = True
-        self.status_label.config(text="Cancelling transfer...")
+        self._pending_status = "Cancelling transfer..."
+        self.status_var.set(self._pending_status)
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""